@@ -21,6 +21,10 @@ class PoHandler(Handler):
     extension = "po"
 
     FUZZY_FLAG = "fuzzy"
+    # Sources reach the handler already decoded, so we pass an explicit
+    # encoding to polib; otherwise it sniffs the charset by running a regex
+    # over the whole content on every `parse`/`compile` call
+    POLIB_ENCODING = "utf-8"
     EXTRACTS_RAW = False
     SPECIFIER = re.compile(
         r"%((?:(?P<ord>\d+)\$|\((?P<key>\w+)\))?(?P<fullvar>[+#\- 0]*(?:\d+)?"
@@ -29,7 +33,7 @@ class PoHandler(Handler):
 
     def parse(self, source, is_source=False):
         try:
-            po = polib.pofile(source)
+            po = polib.pofile(source, encoding=self.POLIB_ENCODING)
         except Exception as e:
             raise ParseError("Error while validating PO file syntax: {}".format(e))
         existing_keys = set()
@@ -264,7 +268,7 @@ class PoHandler(Handler):
         if isinstance(template, polib.POFile):
             po = template
         else:
-            po = polib.pofile(template)
+            po = polib.pofile(template, encoding=self.POLIB_ENCODING)
 
         indexes_to_remove = []
         for i, entry in enumerate(po):
@@ -1,14 +1,26 @@
 import fnmatch
 import six
+from functools import lru_cache
 from io import open
 
-from os import listdir, path
-from os.path import isfile, join
+from os import path, scandir
+from os.path import isfile
 
 from openformats.exceptions import ParseError
 from openformats.tests.utils import translate_stringset
 
 
+@lru_cache(maxsize=None)
+def _read_test_file(filepath):
+    """
+    Read a test data file. Test data files are never modified, so each one
+    is read and decoded only once per process.
+    """
+
+    with open(filepath, "r", encoding='utf-8') as myfile:
+        return myfile.read()
+
+
 class CommonFormatTestMixin(object):
     """
     Define a set of tests to be run by every file format.
@@ -35,10 +47,11 @@ class CommonFormatTestMixin(object):
 
         # Find source files to use as a base to read all others
         en_files = []
-        for f in listdir(self.TESTFILE_BASE):
-            if (isfile(join(self.TESTFILE_BASE, f)) and
-                    fnmatch.fnmatch(f, '[!.]*_en.*')):
-                en_files.append(f)
+        with scandir(self.TESTFILE_BASE) as entries:
+            for entry in entries:
+                if (entry.is_file() and
+                        fnmatch.fnmatch(entry.name, '[!.]*_en.*')):
+                    en_files.append(entry.name)
 
         file_nums = set([f.split("_")[0] for f in en_files])
         for num in file_nums:
@@ -48,8 +61,7 @@ class CommonFormatTestMixin(object):
                     name, self.HANDLER_CLASS.extension))
                 if not isfile(filepath):
                     self.fail("Bad test files: Expected to find %s" % filepath)
-                with open(filepath, "r", encoding='utf-8') as myfile:
-                    self.data[name] = myfile.read()
+                self.data[name] = _read_test_file(filepath)
 
     def setUp(self):
         self.handler = self.HANDLER_CLASS()
@@ -18,10 +18,11 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
         self.order_generator = itertools.count()
 
     def _create_openstring(self, pluralized, extra_context=None):
-        context_dict = extra_context if extra_context is not None else {}
-        context_dict.update(
-            {"order": next(self.order_generator), "pluralized": pluralized}
-        )
+        context_dict = {
+            **(extra_context or {}),
+            "order": next(self.order_generator),
+            "pluralized": pluralized,
+        }
         key = generate_random_string()
         if pluralized:
             key = ":".join([key, generate_random_string()])
@@ -33,7 +34,6 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
             else generate_random_string(),
             **context_dict
         )
-        openstring.string_hash
         return openstring
 
     def test_openstring_has_all_fields(self):
@@ -77,6 +77,14 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
         string1 = self._create_openstring(False)
         string2 = self._create_openstring(False)
         string3 = self._create_openstring(False)
+        values = {
+            "s1_key": string1.key,
+            "s1_str": string1.string,
+            "s2_key": string2.key,
+            "s2_str": string2.string,
+            "s3_key": string3.key,
+            "s3_str": string3.string,
+        }
         source = strip_leading_spaces(
             """
             msgid ""
@@ -90,16 +98,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
 
             msgid "{s3_key}"
             msgstr "{s3_str}"
-        """.format(
-                **{
-                    "s1_key": string1.key,
-                    "s1_str": string1.string,
-                    "s2_key": string2.key,
-                    "s2_str": string2.string,
-                    "s3_key": string3.key,
-                    "s3_str": string3.string,
-                }
-            )
+        """.format_map(values)
         )
         template, stringset = self.handler.parse(source)
         compiled = self.handler.compile(template, [string1, string2, string3])
@@ -118,16 +117,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
 
                 msgid "{s3_key}"
                 msgstr "{s3_str}"
-                """.format(
-                    **{
-                        "s1_key": string1.key,
-                        "s1_str": string1.string,
-                        "s2_key": string2.key,
-                        "s2_str": string2.string,
-                        "s3_key": string3.key,
-                        "s3_str": string3.string,
-                    }
-                )
+                """.format_map(values)
             ),
         )
 
@@ -135,6 +125,14 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
         string1 = self._create_openstring(False)
         string2 = self._create_openstring(False)
         string3 = self._create_openstring(False)
+        values = {
+            "s1_key": string1.key,
+            "s1_str": string1.string,
+            "s2_key": string2.key,
+            "s2_str": string2.string,
+            "s3_key": string3.key,
+            "s3_str": string3.string,
+        }
         source = strip_leading_spaces(
             """
             #
@@ -150,16 +148,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
 
             msgid "{s3_key}"
             msgstr "{s3_str}"
-        """.format(
-                **{
-                    "s1_key": string1.key,
-                    "s1_str": string1.string,
-                    "s2_key": string2.key,
-                    "s2_str": string2.string,
-                    "s3_key": string3.key,
-                    "s3_str": string3.string,
-                }
-            )
+        """.format_map(values)
         )
         template, stringset = self.handler.parse(source)
         compiled = self.handler.compile(template, [string1, string3])
@@ -174,14 +163,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
 
                 msgid "{s3_key}"
                 msgstr "{s3_str}"
-                """.format(
-                    **{
-                        "s1_key": string1.key,
-                        "s1_str": string1.string,
-                        "s3_key": string3.key,
-                        "s3_str": string3.string,
-                    }
-                )
+                """.format_map(values)
             ),
         )
 
@@ -192,6 +174,20 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
         keys2 = string2.key.split(":")
         string3 = self._create_openstring(True)
         keys3 = string3.key.split(":")
+        values = {
+            "s1_key": keys1[0],
+            "s1_key_plural": keys1[1],
+            "s1_str_singular": string1.string[0],
+            "s1_str_plural": string1.string[1],
+            "s2_key": keys2[0],
+            "s2_key_plural": keys2[1],
+            "s2_str_singular": string2.string[0],
+            "s2_str_plural": string2.string[1],
+            "s3_key": keys3[0],
+            "s3_key_plural": keys3[1],
+            "s3_str_singular": string3.string[0],
+            "s3_str_plural": string3.string[1],
+        }
         source = strip_leading_spaces(
             """
             #
@@ -213,22 +209,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
             msgid_plural "{s3_key_plural}"
             msgstr[0] "{s3_str_singular}"
             msgstr[1] "{s3_str_plural}"
-        """.format(
-                **{
-                    "s1_key": keys1[0],
-                    "s1_key_plural": keys1[1],
-                    "s1_str_singular": string1.string[0],
-                    "s1_str_plural": string1.string[1],
-                    "s2_key": keys2[0],
-                    "s2_key_plural": keys2[1],
-                    "s2_str_singular": string2.string[0],
-                    "s2_str_plural": string2.string[1],
-                    "s3_key": keys3[0],
-                    "s3_key_plural": keys3[1],
-                    "s3_str_singular": string3.string[0],
-                    "s3_str_plural": string3.string[1],
-                }
-            )
+        """.format_map(values)
         )
         template, stringset = self.handler.parse(source)
         compiled = self.handler.compile(template, [string1, string3])
@@ -247,23 +228,16 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
                 msgid_plural "{s3_key_plural}"
                 msgstr[0] "{s3_str_singular}"
                 msgstr[1] "{s3_str_plural}"
-                """.format(
-                    **{
-                        "s1_key": keys1[0],
-                        "s1_key_plural": keys1[1],
-                        "s1_str_singular": string1.string[0],
-                        "s1_str_plural": string1.string[1],
-                        "s3_key": keys3[0],
-                        "s3_key_plural": keys3[1],
-                        "s3_str_singular": string3.string[0],
-                        "s3_str_plural": string3.string[1],
-                    }
-                )
+                """.format_map(values)
             ),
         )
 
     def test_not_source_removes_untranslated_on_upload(self):
         string1 = self._create_openstring(False)
+        values = {
+            "s1_key": string1.key,
+            "s1_str": string1.string,
+        }
         source = strip_leading_spaces(
             """
             #
@@ -276,9 +250,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
 
             msgid "a_random_key"
             msgstr " "
-        """.format(
-                **{"s1_key": string1.key, "s1_str": string1.string}
-            )
+        """.format_map(values)
         )
         template, stringset = self.handler.parse(source)
         compiled = self.handler.compile(template, [string1])
@@ -290,14 +262,16 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
 
                 msgid "{s1_key}"
                 msgstr "{s1_str}"
-                """.format(
-                    **{"s1_key": string1.key, "s1_str": string1.string}
-                )
+                """.format_map(values)
             ),
         )
 
     def test_duplicated_text_is_not_confused(self):
         string1 = self._create_openstring(False)
+        values = {
+            "s1_key": string1.key,
+            "s1_str": string1.string,
+        }
         source = strip_leading_spaces(
             """
             msgctxt ""
@@ -307,11 +281,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
             msgctxt "t2"
             msgid "{s1_key}"
             msgstr "{s1_key}"
-        """.format(
-                **{
-                    "s1_key": string1.key,
-                }
-            )
+        """.format_map(values)
         )
         template, stringset = self.handler.parse(source)
         compiled = self.handler.compile(template, [string1])
@@ -324,15 +294,19 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
                 msgctxt ""
                 msgid "{s1_key}"
                 msgstr "{s1_str}"
-            """.format(
-                    **{"s1_key": string1.key, "s1_str": string1.string}
-                )
+            """.format_map(values)
             ),
         )
 
     def test_fuzzy_flag_removes_entry_but_keeps_strings(self):
         string1 = self._create_openstring(False)
         string2 = self._create_openstring(False, extra_context={"fuzzy": True})
+        values = {
+            "s1_key": string1.key,
+            "s1_str": string1.string,
+            "s2_key": string2.key,
+            "s2_str": string2.string,
+        }
         source = strip_leading_spaces(
             """
             #
@@ -346,14 +320,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
             #, fuzzy
             msgid "{s2_key}"
             msgstr "{s2_str}"
-        """.format(
-                **{
-                    "s1_key": string1.key,
-                    "s1_str": string1.string,
-                    "s2_key": string2.key,
-                    "s2_str": string2.string,
-                }
-            )
+        """.format_map(values)
         )
         template, stringset = self.handler.parse(source)
         compiled = self.handler.compile(template, [string1])
@@ -365,9 +332,7 @@ class PoTestCase(CommonFormatTestMixin, unittest.TestCase):
 
                 msgid "{s1_key}"
                 msgstr "{s1_str}"
-                """.format(
-                    **{"s1_key": string1.key, "s1_str": string1.string}
-                )
+                """.format_map(values)
             ),
         )
 
@@ -1,12 +1,13 @@
-from random import choice
+from random import choices
 from string import ascii_letters, digits
 
 import six
 
+RANDOM_STRING_CHARACTERS = ascii_letters + digits
+
 
 def generate_random_string(length=20):
-    return ''.join((choice(ascii_letters + digits)
-                    for _ in six.moves.xrange(length)))
+    return ''.join(choices(RANDOM_STRING_CHARACTERS, k=length))
 
 
 def strip_leading_spaces(source):
@@ -25,7 +26,7 @@ def strip_leading_spaces(source):
         '\n1\n00:01:28.797 --> 00:01:30.297 X:240 Y:480\nHello world\n'
     """
 
-    return '\n'.join((line.lstrip() for line in source.split('\n')))
+    return '\n'.join([line.lstrip() for line in source.split('\n')])
 
 
 def bytes_to_string(_bytes):